@@ -19,6 +19,9 @@ engine = create_engine(
     config.SQLALCHEMY_DATABASE_URI,
     pool_size=config.DATABASE_ENGINE_POOL_SIZE,
     max_overflow=config.DATABASE_ENGINE_MAX_OVERFLOW,
+    pool_recycle=config.DATABASE_ENGINE_POOL_RECYCLE,
+    # we rely on tcp keepalives to detect dead connections instead of pinging on every checkout
+    connect_args={"keepalives": 1, "keepalives_idle": config.DATABASE_ENGINE_KEEPALIVES_IDLE},
 )
 
 
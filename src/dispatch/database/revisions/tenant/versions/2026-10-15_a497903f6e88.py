@@ -0,0 +1,28 @@
+"""Adds a partial index on active participant roles.
+
+Revision ID: a497903f6e88
+Revises: 956eb8f8987e
+Create Date: 2026-10-15 07:12:31.482213
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a497903f6e88"
+down_revision = "956eb8f8987e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_participant_role_active",
+        "participant_role",
+        ["participant_id", "role"],
+        postgresql_where=sa.text("renounced_at IS NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_participant_role_active", table_name="participant_role")
@@ -280,7 +280,7 @@ def send_incident_suggested_reading_messages(
 
 def send_incident_created_notifications(incident: Incident, db_session: SessionLocal):
     """Sends incident created notifications."""
-    notification_template = INCIDENT_NOTIFICATION.copy()
+    notification_template = list(INCIDENT_NOTIFICATION)
 
     if incident.status != IncidentStatus.closed:
         notification_template.insert(0, INCIDENT_NAME_WITH_ENGAGEMENT)
@@ -350,7 +350,7 @@ def send_incident_update_notifications(
     """Sends notifications about incident changes."""
     notification_text = "Incident Notification"
     notification_type = MessageType.incident_notification
-    notification_template = INCIDENT_NOTIFICATION_COMMON.copy()
+    notification_template = list(INCIDENT_NOTIFICATION_COMMON)
 
     change = False
     if previous_incident.status != incident.status:
@@ -20,6 +20,7 @@ from dispatch.incident.type import service as incident_type_service
 from dispatch.incident_cost import service as incident_cost_service
 from dispatch.incident_role.service import resolve_role
 from dispatch.participant import flows as participant_flows
+from dispatch.participant import service as participant_service
 from dispatch.participant_role.models import ParticipantRoleType
 from dispatch.plugin import service as plugin_service
 from dispatch.project import service as project_service
@@ -175,92 +176,97 @@ def create(*, db_session, incident_in: IncidentCreate) -> Incident:
     for t in incident_in.tags:
         tag_objs.append(tag_service.get_or_create(db_session=db_session, tag_in=t))
 
-    # We create the incident
-    incident = Incident(
-        description=incident_in.description,
-        incident_priority=incident_priority,
-        incident_severity=incident_severity,
-        incident_type=incident_type,
-        project=project,
-        status=incident_in.status,
-        tags=tag_objs,
-        title=incident_in.title,
-        visibility=visibility,
-    )
-
-    db_session.add(incident)
-    db_session.commit()
-
-    event_service.log_incident_event(
-        db_session=db_session,
-        source="Dispatch Core App",
-        description="Incident created",
-        incident_id=incident.id,
-    )
-
-    # add reporter
-    reporter_email = incident_in.reporter.individual.email
-    participant_flows.add_participant(
-        reporter_email,
-        incident,
-        db_session,
-        role=ParticipantRoleType.reporter,
-    )
-
-    # add commander
-    commander_email = commander_service_id = None
-    if incident_in.commander:
-        commander_email = incident_in.commander.individual.email
-    else:
-        commander_email, commander_service_id = resolve_and_associate_role(
-            db_session=db_session, incident=incident, role=ParticipantRoleType.incident_commander
+    # we create the incident and add its participants in a single transaction, so we never
+    # leave behind an incident without its reporter or commander
+    with participant_service.participant_batch(db_session):
+        # We create the incident
+        incident = Incident(
+            description=incident_in.description,
+            incident_priority=incident_priority,
+            incident_severity=incident_severity,
+            incident_type=incident_type,
+            project=project,
+            status=incident_in.status,
+            tags=tag_objs,
+            title=incident_in.title,
+            visibility=visibility,
         )
 
-    if not commander_email:
-        # we make the reporter the commander if an email for the commander
-        # was not provided or resolved via incident role policies
-        commander_email = reporter_email
-
-    participant_flows.add_participant(
-        commander_email,
-        incident,
-        db_session,
-        service_id=commander_service_id,
-        role=ParticipantRoleType.incident_commander,
-    )
+        db_session.add(incident)
+        db_session.commit()
 
-    # add liaison
-    liaison_email, liaison_service_id = resolve_and_associate_role(
-        db_session=db_session, incident=incident, role=ParticipantRoleType.liaison
-    )
+        event_service.log_incident_event(
+            db_session=db_session,
+            source="Dispatch Core App",
+            description="Incident created",
+            incident_id=incident.id,
+        )
 
-    if liaison_email:
-        # we only add the liaison if we are able to resolve its email
-        # via incident role policies
+        # add reporter
+        reporter_email = incident_in.reporter.individual.email
         participant_flows.add_participant(
-            liaison_email,
+            reporter_email,
             incident,
             db_session,
-            service_id=liaison_service_id,
-            role=ParticipantRoleType.liaison,
+            role=ParticipantRoleType.reporter,
         )
 
-    # add scribe
-    scribe_email, scribe_service_id = resolve_and_associate_role(
-        db_session=db_session, incident=incident, role=ParticipantRoleType.scribe
-    )
+        # add commander
+        commander_email = commander_service_id = None
+        if incident_in.commander:
+            commander_email = incident_in.commander.individual.email
+        else:
+            commander_email, commander_service_id = resolve_and_associate_role(
+                db_session=db_session,
+                incident=incident,
+                role=ParticipantRoleType.incident_commander,
+            )
+
+        if not commander_email:
+            # we make the reporter the commander if an email for the commander
+            # was not provided or resolved via incident role policies
+            commander_email = reporter_email
 
-    if scribe_email:
-        # we only add the scribe if we are able to resolve its email
-        # via incident role policies
         participant_flows.add_participant(
-            scribe_email,
+            commander_email,
             incident,
             db_session,
-            service_id=scribe_service_id,
-            role=ParticipantRoleType.scribe,
+            service_id=commander_service_id,
+            role=ParticipantRoleType.incident_commander,
         )
 
+        # add liaison
+        liaison_email, liaison_service_id = resolve_and_associate_role(
+            db_session=db_session, incident=incident, role=ParticipantRoleType.liaison
+        )
+
+        if liaison_email:
+            # we only add the liaison if we are able to resolve its email
+            # via incident role policies
+            participant_flows.add_participant(
+                liaison_email,
+                incident,
+                db_session,
+                service_id=liaison_service_id,
+                role=ParticipantRoleType.liaison,
+            )
+
+        # add scribe
+        scribe_email, scribe_service_id = resolve_and_associate_role(
+            db_session=db_session, incident=incident, role=ParticipantRoleType.scribe
+        )
+
+        if scribe_email:
+            # we only add the scribe if we are able to resolve its email
+            # via incident role policies
+            participant_flows.add_participant(
+                scribe_email,
+                incident,
+                db_session,
+                service_id=scribe_service_id,
+                role=ParticipantRoleType.scribe,
+            )
+
     return incident
 
 
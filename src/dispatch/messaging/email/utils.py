@@ -13,6 +13,7 @@ from dispatch.messaging.strings import (
     INCIDENT_TASK_REMINDER_DESCRIPTION,
     MessageType,
     render_message_template,
+    render_message_template_batch,
 )
 
 from .filters import env
@@ -59,9 +60,7 @@ def create_multi_message_body(
     """Creates a multi message message body based on message type."""
     template, description = get_template(message_type)
 
-    master_map = []
-    for item in items:
-        master_map.append(render_message_template(message_template, **item))
+    master_map = render_message_template_batch(message_template, items)
 
     kwargs.update({"items": master_map, "description": description})
     return render_html(template.render(**kwargs))
@@ -71,13 +70,10 @@ def create_message_body(message_template: dict, message_type: MessageType, **kwa
     """Creates the correct message body based on message type."""
     template, description = get_template(message_type)
 
-    items_grouped_rendered = []
     if kwargs.get("items_grouped"):
-        items_grouped_template = kwargs["items_grouped_template"]
-        for item in kwargs["items_grouped"]:
-            item_rendered = render_message_template(items_grouped_template, **item)
-            items_grouped_rendered.append(item_rendered)
-
+        items_grouped_rendered = render_message_template_batch(
+            kwargs["items_grouped_template"], kwargs["items_grouped"]
+        )
         kwargs.update({"items": items_grouped_rendered, "description": description})
         return render_html(template.render(**kwargs))
 
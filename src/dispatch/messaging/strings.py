@@ -1,8 +1,8 @@
-import copy
+from functools import lru_cache
 
-from jinja2 import Template
+from jinja2 import Environment, Template
 
-from typing import List
+from typing import List, Union
 
 from dispatch.conversation.enums import ConversationButtonActions
 from dispatch.incident.enums import IncidentStatus
@@ -30,134 +30,106 @@ class MessageType(DispatchEnum):
     incident_task_reminder = "incident-task-reminder"
 
 
+# NOTE: we truncate rendered text to this many characters
+# to prevent hitting limits on SaaS integrations (e.g. Slack)
+MAX_TEXT_LEN = 2500
+
+# NOTE: values must be plain strings, they are not rendered as templates
 INCIDENT_STATUS_DESCRIPTIONS = {
     IncidentStatus.active: "This incident is under active investigation.",
     IncidentStatus.stable: "This incident is stable, the bulk of the investigation has been completed or most of the risk has been mitigated.",
     IncidentStatus.closed: "This no longer requires additional involvement, long term incident action items have been assigned to their respective owners.",
 }
 
-EVERGREEN_REMINDER_DESCRIPTION = """
-You are the owner of the following resources in Dispatch.
-This is a reminder that these resources should be kept up to date in order to effectively
-respond to incidents. Please review and update them, or mark them as deprecated.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_FEEDBACK_DAILY_REPORT_DESCRIPTION = """
-This is a daily report of feedback about incidents handled by you.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_DAILY_REPORT_TITLE = """
-Incidents Daily Report""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_DAILY_REPORT_DESCRIPTION = """
-This is a daily report of incidents that are currently active and incidents that have been marked as stable or closed in the last 24 hours.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_DAILY_REPORT_FOOTER_CONTEXT = """
-For questions about an incident, please reach out to the incident's commander.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_REPORTER_DESCRIPTION = """
-The person who reported the incident. Contact them if the report details need clarification.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_COMMANDER_DESCRIPTION = """
-The Incident Commander (IC) is responsible for
-knowing the full context of the incident.
-Contact them about any questions or concerns.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_COMMANDER_READDED_DESCRIPTION = """
-{{ commander_fullname }} (Incident Commander) has been re-added to the conversation.
-Please, handoff the Incident Commander role before leaving the conversation.""".replace(
-    "\n", " "
-).strip()
-
-TICKET_DESCRIPTION = """
-Ticket for tracking purposes. It contains information and links to resources.""".replace(
-    "\n", " "
-).strip()
-
-TACTICAL_GROUP_DESCRIPTION = """
-Group for managing member access to storage. All participants get added to it.""".replace(
-    "\n", " "
-).strip()
-
-NOTIFICATIONS_GROUP_DESCRIPTION = """
-Group for email notification purposes. All participants get added to it.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_CONVERSATION_DESCRIPTION = """
-Private conversation for real-time discussion. All incident participants get added to it.
-""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_CONVERSATION_REFERENCE_DOCUMENT_DESCRIPTION = """
-Document containing the list of slash commands available to the Incident Commander (IC)
-and participants in the incident conversation.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_CONFERENCE_DESCRIPTION = """
-Video conference and phone bridge to be used throughout the incident.  Password: {{conference_challenge if conference_challenge else 'N/A'}}
-""".replace(
-    "\n", ""
-).strip()
-
-STORAGE_DESCRIPTION = """
-Common storage for all artifacts and
-documents. Add logs, screen captures, or any other data collected during the
-investigation to this folder. It is shared with all participants.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_INVESTIGATION_DOCUMENT_DESCRIPTION = """
-This is a document for all incident facts and context. All
-incident participants are expected to contribute to this document.
-It is shared with all incident participants.""".replace(
-    "\n", " "
-).strip()
-
-CASE_INVESTIGATION_DOCUMENT_DESCRIPTION = """
-This is a document for all investigation facts and context. All
-case participants are expected to contribute to this document.
-It is shared with all participants.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_INVESTIGATION_SHEET_DESCRIPTION = """
-This is a sheet for tracking impacted assets. All
-incident participants are expected to contribute to this sheet.
-It is shared with all incident participants.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_FAQ_DOCUMENT_DESCRIPTION = """
-First time responding to an incident? This
-document answers common questions encountered when
-helping us respond to an incident.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_REVIEW_DOCUMENT_DESCRIPTION = """
-This document will capture all lessons learned, questions, and action items raised during the incident.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_EXECUTIVE_REPORT_DOCUMENT_DESCRIPTION = """
-This is a document that contains an executive report about the incident.""".replace(
-    "\n", " "
-).strip()
+EVERGREEN_REMINDER_DESCRIPTION = (
+    "You are the owner of the following resources in Dispatch. "
+    "This is a reminder that these resources should be kept up to date in order to effectively "
+    "respond to incidents. Please review and update them, or mark them as deprecated."
+)
+
+INCIDENT_FEEDBACK_DAILY_REPORT_DESCRIPTION = (
+    "This is a daily report of feedback about incidents handled by you."
+)
+
+INCIDENT_DAILY_REPORT_TITLE = "Incidents Daily Report"
+
+INCIDENT_DAILY_REPORT_DESCRIPTION = "This is a daily report of incidents that are currently active and incidents that have been marked as stable or closed in the last 24 hours."
+
+INCIDENT_DAILY_REPORT_FOOTER_CONTEXT = (
+    "For questions about an incident, please reach out to the incident's commander."
+)
+
+INCIDENT_REPORTER_DESCRIPTION = (
+    "The person who reported the incident. Contact them if the report details need clarification."
+)
+
+INCIDENT_COMMANDER_DESCRIPTION = (
+    "The Incident Commander (IC) is responsible for "
+    "knowing the full context of the incident. "
+    "Contact them about any questions or concerns."
+)
+
+INCIDENT_COMMANDER_READDED_DESCRIPTION = (
+    "{{ commander_fullname }} (Incident Commander) has been re-added to the conversation. "
+    "Please, handoff the Incident Commander role before leaving the conversation."
+)
+
+TICKET_DESCRIPTION = "Ticket for tracking purposes. It contains information and links to resources."
+
+TACTICAL_GROUP_DESCRIPTION = (
+    "Group for managing member access to storage. All participants get added to it."
+)
+
+NOTIFICATIONS_GROUP_DESCRIPTION = (
+    "Group for email notification purposes. All participants get added to it."
+)
+
+INCIDENT_CONVERSATION_DESCRIPTION = (
+    "Private conversation for real-time discussion. All incident participants get added to it."
+)
+
+INCIDENT_CONVERSATION_REFERENCE_DOCUMENT_DESCRIPTION = (
+    "Document containing the list of slash commands available to the Incident Commander (IC) "
+    "and participants in the incident conversation."
+)
+
+INCIDENT_CONFERENCE_DESCRIPTION = "Video conference and phone bridge to be used throughout the incident.  Password: {{conference_challenge if conference_challenge else 'N/A'}}"
+
+STORAGE_DESCRIPTION = (
+    "Common storage for all artifacts and "
+    "documents. Add logs, screen captures, or any other data collected during the "
+    "investigation to this folder. It is shared with all participants."
+)
+
+INCIDENT_INVESTIGATION_DOCUMENT_DESCRIPTION = (
+    "This is a document for all incident facts and context. All "
+    "incident participants are expected to contribute to this document. "
+    "It is shared with all incident participants."
+)
+
+CASE_INVESTIGATION_DOCUMENT_DESCRIPTION = (
+    "This is a document for all investigation facts and context. All "
+    "case participants are expected to contribute to this document. "
+    "It is shared with all participants."
+)
+
+INCIDENT_INVESTIGATION_SHEET_DESCRIPTION = (
+    "This is a sheet for tracking impacted assets. All "
+    "incident participants are expected to contribute to this sheet. "
+    "It is shared with all incident participants."
+)
+
+INCIDENT_FAQ_DOCUMENT_DESCRIPTION = (
+    "First time responding to an incident? This "
+    "document answers common questions encountered when "
+    "helping us respond to an incident."
+)
+
+INCIDENT_REVIEW_DOCUMENT_DESCRIPTION = "This document will capture all lessons learned, questions, and action items raised during the incident."
+
+INCIDENT_EXECUTIVE_REPORT_DOCUMENT_DESCRIPTION = (
+    "This is a document that contains an executive report about the incident."
+)
 
 DOCUMENT_DESCRIPTIONS = {
     DocumentResourceReferenceTypes.conversation: INCIDENT_CONVERSATION_REFERENCE_DOCUMENT_DESCRIPTION,
@@ -169,56 +141,40 @@ DOCUMENT_DESCRIPTIONS = {
     DocumentResourceTypes.tracking: INCIDENT_INVESTIGATION_SHEET_DESCRIPTION,
 }
 
-INCIDENT_RESOLUTION_DEFAULT = """
-Description of the actions taken to resolve the incident.
-""".replace(
-    "\n", " "
-).strip()
-
-CASE_RESOLUTION_DEFAULT = """
-Description of the actions taken to resolve the case.
-""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_PARTICIPANT_WELCOME_DESCRIPTION = """
-You\'ve been added to this incident, because we think you may
-be able to help resolve it. Please review the incident details below and
-reach out to the incident commander if you have any questions.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_PARTICIPANT_SUGGESTED_READING_DESCRIPTION = """
-Dispatch thinks the following documents might be
-relevant to this incident.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_NOTIFICATION_PURPOSES_FYI = """
-This message is for notification purposes only.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_TACTICAL_REPORT_DESCRIPTION = """
-The following conditions, actions, and needs summarize the current status of the incident.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_NEW_ROLE_DESCRIPTION = """
-{{assigner_fullname if assigner_fullname else assigner_email}} has assigned the role of {{assignee_role}} to {{assignee_fullname if assignee_fullname else assignee_email}}.
-Please, contact {{assignee_fullname if assignee_fullname else assignee_email}} about any questions or concerns.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_REPORT_REMINDER_DESCRIPTION = """You have not provided a {{report_type}} for this incident recently.
-You can use `{{command}}` in the conversation to assist you in writing one.""".replace(
-    "\n", " "
-).strip()
-
-INCIDENT_CLOSE_REMINDER_DESCRIPTION = """The status of this incident hasn't been updated recently.
-You can use `{{command}}` in the conversation to close the incident if it has been resolved and can be closed.""".replace(
-    "\n", " "
-).strip()
+INCIDENT_RESOLUTION_DEFAULT = "Description of the actions taken to resolve the incident."
+
+CASE_RESOLUTION_DEFAULT = "Description of the actions taken to resolve the case."
+
+INCIDENT_PARTICIPANT_WELCOME_DESCRIPTION = (
+    "You've been added to this incident, because we think you may "
+    "be able to help resolve it. Please review the incident details below and "
+    "reach out to the incident commander if you have any questions."
+)
+
+INCIDENT_PARTICIPANT_SUGGESTED_READING_DESCRIPTION = (
+    "Dispatch thinks the following documents might be relevant to this incident."
+)
+
+INCIDENT_NOTIFICATION_PURPOSES_FYI = "This message is for notification purposes only."
+
+INCIDENT_TACTICAL_REPORT_DESCRIPTION = (
+    "The following conditions, actions, and needs summarize the current status of the incident."
+)
+
+INCIDENT_NEW_ROLE_DESCRIPTION = (
+    "{{assigner_fullname if assigner_fullname else assigner_email}} has assigned the role of {{assignee_role}} to {{assignee_fullname if assignee_fullname else assignee_email}}. "
+    "Please, contact {{assignee_fullname if assignee_fullname else assignee_email}} about any questions or concerns."
+)
+
+INCIDENT_REPORT_REMINDER_DESCRIPTION = (
+    "You have not provided a {{report_type}} for this incident recently. "
+    "You can use `{{command}}` in the conversation to assist you in writing one."
+)
+
+INCIDENT_CLOSE_REMINDER_DESCRIPTION = (
+    "The status of this incident hasn't been updated recently. "
+    "You can use `{{command}}` in the conversation to close the incident if it has been resolved and can be closed."
+)
 
 INCIDENT_TASK_NEW_DESCRIPTION = """
 The following incident task has been created and assigned to you by {{task_creator}}: {{task_description}}"""
@@ -226,21 +182,18 @@ The following incident task has been created and assigned to you by {{task_creat
 INCIDENT_TASK_RESOLVED_DESCRIPTION = """
 The following incident task has been resolved: {{task_description}}"""
 
-INCIDENT_TASK_REMINDER_DESCRIPTION = """
-The following incident tasks are assigned to you.
-This is a reminder that these tasks have passed their due date.
-Please review and mark them as resolved if appropriate. Resolving them will stop the reminders.""".replace(
-    "\n", " "
-).strip()
+INCIDENT_TASK_REMINDER_DESCRIPTION = (
+    "The following incident tasks are assigned to you. "
+    "This is a reminder that these tasks have passed their due date. "
+    "Please review and mark them as resolved if appropriate. Resolving them will stop the reminders."
+)
 
 INCIDENT_TASK_LIST_DESCRIPTION = """The following are open incident tasks."""
 
-INCIDENT_OPEN_TASKS_DESCRIPTION = """
-Please resolve or transfer ownership of all the open incident tasks assigned to you in the incident documents or using the <{{dispatch_ui_url}}|Dispatch Web UI>,
-then wait about 30 seconds for Dispatch to update the tasks before leaving the incident conversation.
-""".replace(
-    "\n", " "
-).strip()
+INCIDENT_OPEN_TASKS_DESCRIPTION = (
+    "Please resolve or transfer ownership of all the open incident tasks assigned to you in the incident documents or using the <{{dispatch_ui_url}}|Dispatch Web UI>, "
+    "then wait about 30 seconds for Dispatch to update the tasks before leaving the incident conversation."
+)
 
 INCIDENT_MONITOR_CREATED_DESCRIPTION = """
 A new monitor instance has been created.
@@ -304,25 +257,15 @@ Hey, I see you're the Incident Commander for {{name}} ("{{title}}"). Here are a
 To find a Slack command, simply type `/` in the message field or click the lightning bolt icon to the left of the message field.
 """
 
-INCIDENT_STATUS_CHANGE_DESCRIPTION = """
-The incident status has been changed from {{ incident_status_old }} to {{ incident_status_new }}.""".replace(
-    "\n", " "
-).strip()
+INCIDENT_STATUS_CHANGE_DESCRIPTION = "The incident status has been changed from {{ incident_status_old }} to {{ incident_status_new }}."
 
-INCIDENT_TYPE_CHANGE_DESCRIPTION = """
-The incident type has been changed from {{ incident_type_old }} to {{ incident_type_new }}.""".replace(
-    "\n", " "
-).strip()
+INCIDENT_TYPE_CHANGE_DESCRIPTION = (
+    "The incident type has been changed from {{ incident_type_old }} to {{ incident_type_new }}."
+)
 
-INCIDENT_SEVERITY_CHANGE_DESCRIPTION = """
-The incident severity has been changed from {{ incident_severity_old }} to {{ incident_severity_new }}.""".replace(
-    "\n", " "
-).strip()
+INCIDENT_SEVERITY_CHANGE_DESCRIPTION = "The incident severity has been changed from {{ incident_severity_old }} to {{ incident_severity_new }}."
 
-INCIDENT_PRIORITY_CHANGE_DESCRIPTION = """
-The incident priority has been changed from {{ incident_priority_old }} to {{ incident_priority_new }}.""".replace(
-    "\n", " "
-).strip()
+INCIDENT_PRIORITY_CHANGE_DESCRIPTION = "The incident priority has been changed from {{ incident_priority_old }} to {{ incident_priority_new }}."
 
 INCIDENT_NAME_WITH_ENGAGEMENT = {
     "title": "{{name}} Incident Notification",
@@ -473,7 +416,7 @@ INCIDENT_PARTICIPANT_WELCOME = {
     "text": INCIDENT_PARTICIPANT_WELCOME_DESCRIPTION,
 }
 
-INCIDENT_PARTICIPANT_WELCOME_MESSAGE = [
+INCIDENT_PARTICIPANT_WELCOME_MESSAGE = (
     INCIDENT_PARTICIPANT_WELCOME,
     INCIDENT_TITLE,
     INCIDENT_DESCRIPTION,
@@ -488,9 +431,9 @@ INCIDENT_PARTICIPANT_WELCOME_MESSAGE = [
     INCIDENT_CONFERENCE,
     INCIDENT_CONVERSATION_COMMANDS_REFERENCE_DOCUMENT,
     INCIDENT_FAQ_DOCUMENT,
-]
+)
 
-INCIDENT_RESOURCES_MESSAGE = [
+INCIDENT_RESOURCES_MESSAGE = (
     INCIDENT_TITLE,
     INCIDENT_DESCRIPTION,
     INCIDENT_REPORTER,
@@ -501,48 +444,45 @@ INCIDENT_RESOURCES_MESSAGE = [
     INCIDENT_CONFERENCE,
     INCIDENT_CONVERSATION_COMMANDS_REFERENCE_DOCUMENT,
     INCIDENT_FAQ_DOCUMENT,
-]
+)
 
-INCIDENT_NOTIFICATION_COMMON = [INCIDENT_TITLE]
+INCIDENT_NOTIFICATION_COMMON = (INCIDENT_TITLE,)
 
-INCIDENT_NOTIFICATION = INCIDENT_NOTIFICATION_COMMON.copy()
-INCIDENT_NOTIFICATION.extend(
-    [
-        INCIDENT_DESCRIPTION,
-        INCIDENT_STATUS,
-        INCIDENT_TYPE,
-        INCIDENT_SEVERITY_FYI,
-        INCIDENT_PRIORITY_FYI,
-        INCIDENT_REPORTER,
-        INCIDENT_COMMANDER,
-    ]
+INCIDENT_NOTIFICATION = INCIDENT_NOTIFICATION_COMMON + (
+    INCIDENT_DESCRIPTION,
+    INCIDENT_STATUS,
+    INCIDENT_TYPE,
+    INCIDENT_SEVERITY_FYI,
+    INCIDENT_PRIORITY_FYI,
+    INCIDENT_REPORTER,
+    INCIDENT_COMMANDER,
 )
 
-INCIDENT_TACTICAL_REPORT = [
+INCIDENT_TACTICAL_REPORT = (
     {"title": "Incident Tactical Report", "text": INCIDENT_TACTICAL_REPORT_DESCRIPTION},
     {"title": "Conditions", "text": "{{conditions}}"},
     {"title": "Actions", "text": "{{actions}}"},
     {"title": "Needs", "text": "{{needs}}"},
-]
+)
 
-INCIDENT_EXECUTIVE_REPORT = [
+INCIDENT_EXECUTIVE_REPORT = (
     {"title": "Incident Title", "text": "{{title}}"},
     {"title": "Current Status", "text": "{{current_status}}"},
     {"title": "Overview", "text": "{{overview}}"},
     {"title": "Next Steps", "text": "{{next_steps}}"},
-]
+)
 
-INCIDENT_REPORT_REMINDER = [
+INCIDENT_REPORT_REMINDER = (
     {
         "title": "{{name}} Incident - {{report_type}} Reminder",
         "title_link": "{{ticket_weblink}}",
         "text": INCIDENT_REPORT_REMINDER_DESCRIPTION,
     },
     INCIDENT_TITLE,
-]
+)
 
 
-INCIDENT_CLOSE_REMINDER = [
+INCIDENT_CLOSE_REMINDER = (
     {
         "title": "{{name}} Incident - Close Reminder",
         "title_link": "{{ticket_weblink}}",
@@ -550,9 +490,9 @@ INCIDENT_CLOSE_REMINDER = [
     },
     INCIDENT_TITLE,
     INCIDENT_STATUS,
-]
+)
 
-INCIDENT_TASK_REMINDER = [
+INCIDENT_TASK_REMINDER = (
     {"title": "Incident - {{ name }}", "text": "{{ title }}"},
     {"title": "Creator", "text": "{{ creator }}"},
     {"title": "Description", "text": "{{ description }}"},
@@ -560,100 +500,100 @@ INCIDENT_TASK_REMINDER = [
     {"title": "Created At", "text": "", "datetime": "{{ created_at}}"},
     {"title": "Resolve By", "text": "", "datetime": "{{ resolve_by }}"},
     {"title": "Link", "text": "{{ weblink }}"},
-]
+)
 
-EVERGREEN_REMINDER = [
+EVERGREEN_REMINDER = (
     {"title": "Project", "text": "{{ project }}"},
     {"title": "Type", "text": "{{ resource_type }}"},
     {"title": "Name", "text": "{{ name }}"},
     {"title": "Description", "text": "{{ description }}"},
     {"title": "Link", "text": "{{ weblink }}"},
-]
+)
 
-INCIDENT_NEW_ROLE_NOTIFICATION = [
+INCIDENT_NEW_ROLE_NOTIFICATION = (
     {
         "title": "New {{assignee_role}} - {{assignee_fullname if assignee_fullname else assignee_email}}",
         "title_link": "{{assignee_weblink}}",
         "text": INCIDENT_NEW_ROLE_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_TASK_NEW_NOTIFICATION = [
+INCIDENT_TASK_NEW_NOTIFICATION = (
     {
         "title": "New Incident Task",
         "title_link": "{{task_weblink}}",
         "text": INCIDENT_TASK_NEW_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_TASK_RESOLVED_NOTIFICATION = [
+INCIDENT_TASK_RESOLVED_NOTIFICATION = (
     {
         "title": "Resolved Incident Task",
         "title_link": "{{task_weblink}}",
         "text": INCIDENT_TASK_RESOLVED_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_MONITOR_CREATED_NOTIFICATION = [
+INCIDENT_MONITOR_CREATED_NOTIFICATION = (
     {
         "title": "Monitor Created",
         "title_link": "{{weblink}}",
         "text": INCIDENT_MONITOR_CREATED_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_MONITOR_UPDATE_NOTIFICATION = [
+INCIDENT_MONITOR_UPDATE_NOTIFICATION = (
     {
         "title": "Monitor Status Change",
         "title_link": "{{weblink}}",
         "text": INCIDENT_MONITOR_UPDATE_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_MONITOR_IGNORE_NOTIFICATION = [
+INCIDENT_MONITOR_IGNORE_NOTIFICATION = (
     {
         "title": "Monitor Ignored",
         "title_link": "{{weblink}}",
         "text": INCIDENT_MONITOR_IGNORED_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_WORKFLOW_CREATED_NOTIFICATION = [
+INCIDENT_WORKFLOW_CREATED_NOTIFICATION = (
     {
         "title": "Workflow Created - {{workflow_name}}",
         "text": INCIDENT_WORKFLOW_CREATED_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_WORKFLOW_UPDATE_NOTIFICATION = [
+INCIDENT_WORKFLOW_UPDATE_NOTIFICATION = (
     {
         "title": "Workflow Status Change - {{workflow_name}}",
         "title_link": "{{instance_weblink}}",
         "text": INCIDENT_WORKFLOW_UPDATE_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_WORKFLOW_COMPLETE_NOTIFICATION = [
+INCIDENT_WORKFLOW_COMPLETE_NOTIFICATION = (
     {
         "title": "Workflow Completed - {{workflow_name}}",
         "title_link": "{{instance_weblink}}",
         "text": INCIDENT_WORKFLOW_COMPLETE_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_COMMANDER_READDED_NOTIFICATION = [
-    {"title": "Incident Commander Re-Added", "text": INCIDENT_COMMANDER_READDED_DESCRIPTION}
-]
+INCIDENT_COMMANDER_READDED_NOTIFICATION = (
+    {"title": "Incident Commander Re-Added", "text": INCIDENT_COMMANDER_READDED_DESCRIPTION},
+)
 
-INCIDENT_CLOSED_INFORMATION_REVIEW_REMINDER_NOTIFICATION = [
+INCIDENT_CLOSED_INFORMATION_REVIEW_REMINDER_NOTIFICATION = (
     {
         "title": "{{name}} Incident - Information Review Reminder",
         "title_link": "{{dispatch_ui_incident_url}}",
         "text": INCIDENT_CLOSED_INFORMATION_REVIEW_REMINDER_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_CLOSED_RATING_FEEDBACK_NOTIFICATION = [
+INCIDENT_CLOSED_RATING_FEEDBACK_NOTIFICATION = (
     {
         "title": "{{name}} Incident - Rating and Feedback",
         "title_link": "{{ticket_weblink}}",
@@ -665,17 +605,17 @@ INCIDENT_CLOSED_RATING_FEEDBACK_NOTIFICATION = [
                 "button_action": ConversationButtonActions.feedback_notification_provide,
             }
         ],
-    }
-]
+    },
+)
 
-INCIDENT_FEEDBACK_DAILY_REPORT = [
+INCIDENT_FEEDBACK_DAILY_REPORT = (
     {"title": "Incident", "text": "{{ name }}"},
     {"title": "Incident Title", "text": "{{ title }}"},
     {"title": "Rating", "text": "{{ rating }}"},
     {"title": "Feedback", "text": "{{ feedback }}"},
     {"title": "Participant", "text": "{{ participant }}"},
     {"title": "Created At", "text": "", "datetime": "{{ created_at}}"},
-]
+)
 
 INCIDENT_DAILY_REPORT_HEADER = {
     "type": "header",
@@ -691,13 +631,13 @@ INCIDENT_DAILY_REPORT_FOOTER = {
     "text": INCIDENT_DAILY_REPORT_FOOTER_CONTEXT,
 }
 
-INCIDENT_DAILY_REPORT = [
+INCIDENT_DAILY_REPORT = (
     INCIDENT_DAILY_REPORT_HEADER,
     INCIDENT_DAILY_REPORT_HEADER_DESCRIPTION,
     INCIDENT_DAILY_REPORT_FOOTER,
-]
+)
 
-INCIDENT = [
+INCIDENT = (
     INCIDENT_NAME_WITH_ENGAGEMENT_NO_DESCRIPTION,
     INCIDENT_TITLE,
     INCIDENT_STATUS,
@@ -705,73 +645,215 @@ INCIDENT = [
     INCIDENT_SEVERITY,
     INCIDENT_PRIORITY,
     INCIDENT_COMMANDER,
-]
+)
 
 
-INCIDENT_MANAGEMENT_HELP_TIPS_MESSAGE = [
+INCIDENT_MANAGEMENT_HELP_TIPS_MESSAGE = (
     {
         "title": "{{name}} Incident - Management Help Tips",
         "text": INCIDENT_MANAGEMENT_HELP_TIPS_MESSAGE_DESCRIPTION,
-    }
-]
+    },
+)
 
-INCIDENT_OPEN_TASKS = [
+INCIDENT_OPEN_TASKS = (
     {
         "title": "{{title}}",
         "text": INCIDENT_OPEN_TASKS_DESCRIPTION,
-    }
-]
+    },
+)
 
 
-def render_message_template(message_template: List[dict], **kwargs):
-    """Renders the jinja data included in the template itself."""
-    data = []
-    new_copy = copy.deepcopy(message_template)
-    for d in new_copy:
-        if d.get("header"):
-            d["header"] = Template(d["header"]).render(**kwargs)
+# the message templates of this module, their rendering plans and the ones of their blocks
+# are kept once first used, so they must not be modified in place
+_MODULE_TEMPLATES = (
+    INCIDENT_PARTICIPANT_WELCOME_MESSAGE,
+    INCIDENT_RESOURCES_MESSAGE,
+    INCIDENT_NOTIFICATION_COMMON,
+    INCIDENT_NOTIFICATION,
+    INCIDENT_TACTICAL_REPORT,
+    INCIDENT_EXECUTIVE_REPORT,
+    INCIDENT_REPORT_REMINDER,
+    INCIDENT_CLOSE_REMINDER,
+    INCIDENT_TASK_REMINDER,
+    EVERGREEN_REMINDER,
+    INCIDENT_NEW_ROLE_NOTIFICATION,
+    INCIDENT_TASK_NEW_NOTIFICATION,
+    INCIDENT_TASK_RESOLVED_NOTIFICATION,
+    INCIDENT_MONITOR_CREATED_NOTIFICATION,
+    INCIDENT_MONITOR_UPDATE_NOTIFICATION,
+    INCIDENT_MONITOR_IGNORE_NOTIFICATION,
+    INCIDENT_WORKFLOW_CREATED_NOTIFICATION,
+    INCIDENT_WORKFLOW_UPDATE_NOTIFICATION,
+    INCIDENT_WORKFLOW_COMPLETE_NOTIFICATION,
+    INCIDENT_COMMANDER_READDED_NOTIFICATION,
+    INCIDENT_CLOSED_INFORMATION_REVIEW_REMINDER_NOTIFICATION,
+    INCIDENT_CLOSED_RATING_FEEDBACK_NOTIFICATION,
+    INCIDENT_FEEDBACK_DAILY_REPORT,
+    INCIDENT_DAILY_REPORT,
+    INCIDENT,
+    INCIDENT_MANAGEMENT_HELP_TIPS_MESSAGE,
+    INCIDENT_OPEN_TASKS,
+)
+
+
+_RENDERED_FIELDS = frozenset(("header", "title", "title_link", "text", "datetime", "context"))
+_RENDERED_BUTTON_FIELDS = frozenset(("button_text", "button_value", "button_action", "button_url"))
+
+# the ways a field of a rendering plan is filled in
+_STATIC, _RENDER, _LINK, _BUTTONS = range(4)
+
+# a single environment shared by all message templates
+_env = Environment(autoescape=False, auto_reload=False, optimized=True)
+
+# rendering plans of this module's templates and blocks keyed by id, holding on to
+# the object itself so its id can't be reused by another template
+_PLANS = {}
+
+
+@lru_cache(maxsize=None)
+def _tmpl(src: str) -> Template:
+    """Compiles a template source string once and caches the result."""
+    return _env.from_string(src)
+
+
+def _compile(src: str) -> Union[str, Template]:
+    """Compiles a template source string, returning static strings as jinja would render them."""
+    if "{" in src or "\r" in src:
+        return _tmpl(src)
+
+    # jinja drops a single trailing newline, so we do the same for static strings
+    return str(src[:-1] if src.endswith("\n") else src)
+
+
+def _render(compiled: Union[str, Template], kwargs: dict) -> str:
+    """Renders a compiled template source string."""
+    if isinstance(compiled, str):
+        return compiled
+
+    return compiled.render(kwargs)
+
 
-        if d.get("title"):
-            d["title"] = Template(d["title"]).render(**kwargs)
+def _plan_fields(d: dict, rendered_fields: frozenset) -> tuple:
+    """Classifies the fields of a block or button as static or rendered."""
+    fields = []
+    for field, value in d.items():
+        if field == "status_mapping":
+            # status descriptions are resolved separately and not passed on to the plugins
+            continue
+        elif not value:
+            fields.append((field, _STATIC, value))
+        elif field == "title_link":
+            # links are rendered ahead of the rest of the block
+            fields.append((field, _LINK, None))
+        elif field in rendered_fields:
+            fields.append((field, _RENDER, _compile(value)))
+        elif field == "buttons":
+            buttons = tuple(_plan_fields(button, _RENDERED_BUTTON_FIELDS) for button in value)
+            fields.append((field, _BUTTONS, buttons))
+        else:
+            fields.append((field, _STATIC, value))
+    return tuple(fields)
 
-        if d.get("title_link"):
-            d["title_link"] = Template(d["title_link"]).render(**kwargs)
 
-            if d["title_link"] == "None":  # skip blocks with no content
+@lru_cache(maxsize=None)
+def _module_templates() -> frozenset:
+    """Returns the ids of this module's message templates and of their blocks."""
+    ids = set()
+    for message_template in _MODULE_TEMPLATES:
+        ids.add(id(message_template))
+        ids.update(id(d) for d in message_template)
+    return frozenset(ids)
+
+
+def _memoize(obj, plan_func) -> tuple:
+    """Plans this module's templates and blocks once, other templates on every call."""
+    cached = _PLANS.get(id(obj))
+    if cached:
+        return cached[1]
+
+    plan = plan_func(obj)
+    if id(obj) in _module_templates():
+        _PLANS[id(obj)] = (obj, plan)
+    return plan
+
+
+def _plan_block(d: dict) -> tuple:
+    """Gets the rendering plan of a single message block."""
+    return _memoize(d, _make_block_plan)
+
+
+def _make_block_plan(d: dict) -> tuple:
+    """Creates the rendering plan of a single message block."""
+    title_link = d.get("title_link")
+    return (
+        _compile(title_link) if title_link else None,
+        d.get("status_mapping"),
+        bool(d.get("text")),
+        _plan_fields(d, _RENDERED_FIELDS),
+    )
+
+
+def _plan(message_template: List[dict]) -> tuple:
+    """Gets the rendering plan of a message template."""
+    return _memoize(message_template, _make_plan)
+
+
+def _make_plan(message_template: List[dict]) -> tuple:
+    """Creates the rendering plan of a message template."""
+    return tuple(_plan_block(d) for d in message_template)
+
+
+def _render_fields(fields: tuple, kwargs: dict, title_link: str = None) -> dict:
+    """Renders the planned fields of a block or button into a new dict."""
+    rendered = {}
+    for field, kind, value in fields:
+        if kind == _RENDER:
+            rendered[field] = _render(value, kwargs)
+        elif kind == _LINK:
+            rendered[field] = title_link
+        elif kind == _BUTTONS:
+            # render a new button array given the template
+            rendered[field] = [_render_fields(button, kwargs) for button in value]
+        else:
+            rendered[field] = value
+    return rendered
+
+
+def _render_plan(plan: tuple, kwargs: dict) -> List[dict]:
+    """Renders a message template given its rendering plan."""
+    data = []
+    for title_link, status_mapping, has_text, fields in plan:
+        # we render the link first so we don't render blocks we end up skipping
+        if title_link is not None:
+            title_link = _render(title_link, kwargs)
+
+            if title_link == "None":  # skip blocks with no content
                 continue
 
             # skip blocks that do not have new links rendered, as no real value was provided
-            if not d["title_link"]:
+            if not title_link:
                 continue
 
-        if d.get("text"):
-            d["text"] = Template(d["text"]).render(**kwargs)
-
-            # NOTE: we truncate the string to 2500 characters
-            # to prevent hitting limits on SaaS integrations (e.g. Slack)
-            d["text"] = d["text"] if len(d["text"]) <= 2500 else d["text"][:2500]
+        block = _render_fields(fields, kwargs, title_link)
 
-        # render a new button array given the template
-        if d.get("buttons"):
-            for button in d["buttons"]:
-                button["button_text"] = Template(button["button_text"]).render(**kwargs)
-                button["button_value"] = Template(button["button_value"]).render(**kwargs)
+        if has_text:
+            text = block["text"]
+            block["text"] = text if len(text) <= MAX_TEXT_LEN else text[:MAX_TEXT_LEN]
 
-                if button.get("button_action"):
-                    button["button_action"] = Template(button["button_action"]).render(**kwargs)
+        if status_mapping:
+            block["text"] = status_mapping.get(kwargs["status"], "")
 
-                if button.get("button_url"):
-                    button["button_url"] = Template(button["button_url"]).render(**kwargs)
+        data.append(block)
 
-        if d.get("status_mapping"):
-            d["text"] = d["status_mapping"][kwargs["status"]]
+    return data
 
-        if d.get("datetime"):
-            d["datetime"] = Template(d["datetime"]).render(**kwargs)
 
-        if d.get("context"):
-            d["context"] = Template(d["context"]).render(**kwargs)
+def render_message_template(message_template: List[dict], **kwargs):
+    """Renders the jinja data included in the template itself."""
+    return _render_plan(_plan(message_template), kwargs)
 
-        data.append(d)
 
-    return data
+def render_message_template_batch(message_template: List[dict], items: List[dict]):
+    """Renders the template once for each item, planning the template only once."""
+    plan = _plan(message_template)
+    return [_render_plan(plan, item) for item in items]
@@ -1,67 +1,169 @@
+from contextlib import contextmanager
 from typing import List, Optional
 
-from dispatch.individual import service as individual_service
+from sqlalchemy import bindparam, event
+from sqlalchemy.ext import baked
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
+
 from dispatch.individual.models import IndividualContact
-from dispatch.participant_role import service as participant_role_service
 from dispatch.participant_role.models import ParticipantRole, ParticipantRoleCreate
 from dispatch.plugin import service as plugin_service
 from dispatch.service import service as service_service
 
 from .models import Participant, ParticipantCreate, ParticipantUpdate
 
+# used for any details the contact plugin doesn't know about the individual
+_INDIVIDUAL_INFO_DEFAULTS = {"location": "Unknown", "team": "Unknown", "department": "Unknown"}
+
+# caches the construction and compilation of the queries we run on every incident event
+bakery = baked.bakery()
+
+
+def _load_options():
+    """Eager loads the relationships callers access on the participants we return."""
+    return (
+        selectinload(Participant.participant_roles),
+        joinedload(Participant.individual),
+        joinedload(Participant.service),
+    )
+
+
+def _get_contact_plugin(*, db_session, project_id: int):
+    """Gets the active contact plugin, reusing the lookup within a participant batch."""
+    batch = db_session.info.get("participant_batch")
+    if batch is None:
+        return plugin_service.get_active_instance(
+            db_session=db_session, project_id=project_id, plugin_type="contact"
+        )
+
+    # nothing is committed during a batch, so the instance we fetched is neither expired
+    # nor stale until the batch ends
+    contact_plugins = batch.setdefault("contact_plugins", {})
+    if project_id not in contact_plugins:
+        contact_plugins[project_id] = plugin_service.get_active_instance(
+            db_session=db_session, project_id=project_id, plugin_type="contact"
+        )
+    return contact_plugins[project_id]
+
+
+@contextmanager
+def participant_batch(db_session):
+    """Writes all the changes made within the block in a single database transaction.
+
+    Commits issued within the block, by this service or by the flows calling it, only
+    release a savepoint, which is started again right away. The transaction is committed
+    when the block exits, or rolled back to where the block started if it raises. If the
+    caller already has a savepoint open, the batch only releases its own savepoints and
+    leaves committing to the caller.
+    """
+    if "participant_batch" in db_session.info:
+        # we are already part of an outer batch, which will commit for us
+        yield
+        return
+
+    batch_savepoint = db_session.begin_nested()
+    savepoints = [db_session.begin_nested()]
+
+    def restart_savepoint(session, transaction):
+        if transaction is savepoints[-1]:
+            savepoints.append(session.begin_nested())
+
+    db_session.info["participant_batch"] = {}
+    event.listen(db_session, "after_transaction_end", restart_savepoint)
+    try:
+        yield
+    except Exception:
+        event.remove(db_session, "after_transaction_end", restart_savepoint)
+        while db_session.transaction is not batch_savepoint.parent:
+            db_session.rollback()
+        raise
+    else:
+        event.remove(db_session, "after_transaction_end", restart_savepoint)
+        while db_session.transaction is not batch_savepoint.parent:
+            db_session.commit()
+        if batch_savepoint.parent.parent is None:
+            # we never commit a savepoint the caller opened, only the root transaction
+            db_session.commit()
+    finally:
+        db_session.info.pop("participant_batch", None)
+
+
+def _participant_columns(participant_in: ParticipantCreate) -> dict:
+    """Returns the participant's column values without serializing its nested models."""
+    # NOTE: iterating a pydantic model yields its fields as is, unlike .dict() which
+    # recursively copies every nested model only for us to exclude them
+    return {
+        field: value
+        for field, value in participant_in
+        if field not in ("participant_roles", "service")
+    }
+
 
 def get(*, db_session, participant_id: int) -> Optional[Participant]:
     """Get a participant by its id."""
-    return db_session.query(Participant).filter(Participant.id == participant_id).first()
+    return db_session.query(Participant).get(participant_id)
 
 
 def get_by_incident_id_and_role(
     *, db_session, incident_id: int, role: str
 ) -> Optional[Participant]:
     """Get a participant by incident id and role name."""
-    return (
-        db_session.query(Participant)
+    query = bakery(
+        lambda session: session.query(Participant)
+        .options(*_load_options())
         .join(ParticipantRole)
-        .filter(Participant.incident_id == incident_id)
+        .filter(Participant.incident_id == bindparam("incident_id"))
         .filter(ParticipantRole.renounced_at.is_(None))
-        .filter(ParticipantRole.role == role)
-        .one_or_none()
+        .filter(ParticipantRole.role == bindparam("role"))
     )
+    return query(db_session).params(incident_id=incident_id, role=role).one_or_none()
 
 
 def get_by_incident_id_and_email(
     *, db_session, incident_id: int, email: str
 ) -> Optional[Participant]:
     """Get a participant by incident id and email."""
-    return (
-        db_session.query(Participant)
-        .join(IndividualContact)
-        .filter(Participant.incident_id == incident_id)
-        .filter(IndividualContact.email == email)
-        .one_or_none()
+    query = bakery(
+        lambda session: session.query(Participant)
+        # the join both filters on the email and loads the individual
+        .join(Participant.individual)
+        .options(
+            selectinload(Participant.participant_roles),
+            contains_eager(Participant.individual),
+            joinedload(Participant.service),
+        )
+        .filter(Participant.incident_id == bindparam("incident_id"))
+        .filter(IndividualContact.email == bindparam("email"))
     )
+    return query(db_session).params(incident_id=incident_id, email=email).one_or_none()
 
 
 def get_by_incident_id_and_service_id(
     *, db_session, incident_id: int, service_id: int
 ) -> Optional[Participant]:
     """Get participant by incident and service id."""
-    return (
-        db_session.query(Participant)
-        .filter(Participant.incident_id == incident_id)
-        .filter(Participant.service_id == service_id)
-        .one_or_none()
+    query = bakery(
+        lambda session: session.query(Participant)
+        .options(*_load_options())
+        .filter(Participant.incident_id == bindparam("incident_id"))
+        .filter(Participant.service_id == bindparam("service_id"))
     )
+    return query(db_session).params(incident_id=incident_id, service_id=service_id).one_or_none()
 
 
 def get_by_incident_id_and_conversation_id(
     *, db_session, incident_id: int, user_conversation_id: str
 ) -> Optional[Participant]:
     """Get participant by incident and user_conversation id."""
+    query = bakery(
+        lambda session: session.query(Participant)
+        .options(*_load_options())
+        .filter(Participant.incident_id == bindparam("incident_id"))
+        .filter(Participant.user_conversation_id == bindparam("user_conversation_id"))
+    )
     return (
-        db_session.query(Participant)
-        .filter(Participant.incident_id == incident_id)
-        .filter(Participant.user_conversation_id == user_conversation_id)
+        query(db_session)
+        .params(incident_id=incident_id, user_conversation_id=user_conversation_id)
         .one_or_none()
     )
 
@@ -73,7 +175,11 @@ def get_all(*, db_session) -> List[Optional[Participant]]:
 
 def get_all_by_incident_id(*, db_session, incident_id: int) -> List[Optional[Participant]]:
     """Get all participants by incident id."""
-    return db_session.query(Participant).filter(Participant.incident_id == incident_id)
+    return (
+        db_session.query(Participant)
+        .options(*_load_options())
+        .filter(Participant.incident_id == incident_id)
+    )
 
 
 def get_or_create(
@@ -85,41 +191,39 @@ def get_or_create(
     participant_roles: List[ParticipantRoleCreate],
 ) -> Participant:
     """Gets an existing participant object or creates a new one."""
-    from dispatch.incident import service as incident_service
+    from dispatch.incident.models import Incident
 
-    participant = (
-        db_session.query(Participant)
+    # we only fetch the id to decide whether we need to create the participant
+    participant_id = (
+        db_session.query(Participant.id)
         .filter(Participant.incident_id == incident_id)
         .filter(Participant.individual_contact_id == individual_id)
-        .one_or_none()
+        .scalar()
     )
 
-    if not participant:
-        incident = incident_service.get(db_session=db_session, incident_id=incident_id)
-
-        # We get information about the individual
-        individual_contact = individual_service.get(
-            db_session=db_session, individual_contact_id=individual_id
+    if not participant_id:
+        # we only need the incident's project id and the individual's email, so we fetch
+        # both columns in a single select instead of loading the incident and the individual
+        project_id, email = (
+            db_session.query(Incident.project_id, IndividualContact.email)
+            .filter(Incident.id == incident_id)
+            .filter(IndividualContact.id == individual_id)
+            .one()
         )
 
-        individual_info = {}
-        contact_plugin = plugin_service.get_active_instance(
-            db_session=db_session, project_id=incident.project.id, plugin_type="contact"
-        )
+        individual_info = _INDIVIDUAL_INFO_DEFAULTS
+        contact_plugin = _get_contact_plugin(db_session=db_session, project_id=project_id)
         if contact_plugin:
-            individual_info = contact_plugin.instance.get(
-                individual_contact.email, db_session=db_session
-            )
-
-        location = individual_info.get("location", "Unknown")
-        team = individual_info.get("team", "Unknown")
-        department = individual_info.get("department", "Unknown")
+            individual_info = {
+                **_INDIVIDUAL_INFO_DEFAULTS,
+                **contact_plugin.instance.get(email, db_session=db_session),
+            }
 
         participant_in = ParticipantCreate(
             participant_roles=participant_roles,
-            team=team,
-            department=department,
-            location=location,
+            team=individual_info["team"],
+            department=individual_info["department"],
+            location=individual_info["location"],
         )
 
         if service_id:
@@ -127,20 +231,23 @@ def get_or_create(
 
         participant = create(db_session=db_session, participant_in=participant_in)
     else:
-        # we add additional roles to the participant
-        for participant_role in participant_roles:
-            participant.participant_roles.append(
-                participant_role_service.create(
-                    db_session=db_session, participant_role_in=participant_role
-                )
-            )
-
-        if not participant.service:
+        participant = (
+            db_session.query(Participant)
+            .options(selectinload(Participant.participant_roles))
+            .get(participant_id)
+        )
+
+        # we add additional roles to the participant, they all get inserted in the same flush
+        participant.participant_roles.extend(
+            [ParticipantRole(role=participant_role.role) for participant_role in participant_roles]
+        )
+
+        if service_id and not participant.service_id:
             # we only associate the service with the participant once to prevent overwrites
-            service = service_service.get(db_session=db_session, service_id=service_id)
-            if service:
-                participant.service_id = service_id
-                participant.service = service
+            # NOTE: we only set the foreign key, the service is loaded if and when it is accessed
+            participant.service_id = service_id
+            # the commit does not expire the participant within a participant batch
+            db_session.expire(participant, ["service"])
 
         db_session.commit()
 
@@ -149,8 +256,9 @@ def get_or_create(
 
 def create(*, db_session, participant_in: ParticipantCreate) -> Participant:
     """Create a new participant."""
+    # the roles are inserted along with the participant in a single flush
     participant_roles = [
-        participant_role_service.create(db_session=db_session, participant_role_in=participant_role)
+        ParticipantRole(role=participant_role.role)
         for participant_role in participant_in.participant_roles
     ]
 
@@ -159,7 +267,7 @@ def create(*, db_session, participant_in: ParticipantCreate) -> Participant:
         service = service_service.get(db_session=db_session, service_id=participant_in.service.id)
 
     participant = Participant(
-        **participant_in.dict(exclude={"participant_roles", "service"}),
+        **_participant_columns(participant_in),
         service=service,
         participant_roles=participant_roles,
     )
@@ -170,24 +278,38 @@ def create(*, db_session, participant_in: ParticipantCreate) -> Participant:
 
 
 def create_all(*, db_session, participants_in: List[ParticipantCreate]) -> List[Participant]:
-    """Create a list of participants."""
-    participants = [Participant(**t.dict()) for t in participants_in]
-    db_session.bulk_save_objects(participants)
+    """Create a list of participants. Participant roles are not created."""
+    if not participants_in:
+        return []
+
+    # we insert all participants with a single multi-row insert statement
+    rows = [
+        {
+            **_participant_columns(t),
+            "service_id": t.service.id if t.service else None,
+        }
+        for t in participants_in
+    ]
+    table = Participant.__table__
+    result = db_session.execute(table.insert().values(rows).returning(table.c.id))
+    participant_ids = [row.id for row in result]
     db_session.commit()
-    return participants
+
+    # we return the participants in the order they were given to us
+    participants = db_session.query(Participant).filter(Participant.id.in_(participant_ids))
+    participants_by_id = {participant.id: participant for participant in participants}
+    return [participants_by_id[participant_id] for participant_id in participant_ids]
 
 
 def update(
     *, db_session, participant: Participant, participant_in: ParticipantUpdate
 ) -> Participant:
     """Updates a participant."""
-    participant_data = participant.dict()
-
-    update_data = participant_in.dict(skip_defaults=True)
+    # we only set the columns the caller provided, the individual is not updated here
+    update_data = participant_in.dict(exclude_unset=True, exclude={"individual"})
 
-    for field in participant_data:
-        if field in update_data:
-            setattr(participant, field, update_data[field])
+    for field, value in update_data.items():
+        setattr(participant, field, value)
 
     db_session.commit()
     return participant
@@ -195,6 +317,6 @@ def update(
 
 def delete(*, db_session, participant_id: int):
     """Deletes a participant."""
-    participant = db_session.query(Participant).filter(Participant.id == participant_id).first()
+    participant = db_session.query(Participant).get(participant_id)
     db_session.delete(participant)
     db_session.commit()
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from typing import List, Optional
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, text
 
 from dispatch.database.core import Base
 from dispatch.models import DispatchBase, PrimaryKey
@@ -11,6 +11,16 @@ from .enums import ParticipantRoleType
 
 
 class ParticipantRole(Base):
+    # speeds up looking up the active roles of a participant
+    __table_args__ = (
+        Index(
+            "ix_participant_role_active",
+            "participant_id",
+            "role",
+            postgresql_where=text("renounced_at IS NULL"),
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
     assumed_at = Column(DateTime, default=datetime.utcnow)
     renounced_at = Column(DateTime)
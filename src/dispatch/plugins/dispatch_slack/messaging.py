@@ -17,7 +17,7 @@ from dispatch.messaging.strings import (
     INCIDENT_TASK_LIST_DESCRIPTION,
     INCIDENT_TASK_REMINDER_DESCRIPTION,
     MessageType,
-    render_message_template,
+    render_message_template_batch,
 )
 from dispatch.plugins.dispatch_slack.config import SlackConfiguration
 
@@ -244,20 +244,19 @@ def create_message_blocks(
     if description:  # include optional description text (based on message type)
         blocks.append(Section(text=description))
 
-    for item in items:
-        if message_template:
-            rendered_items = render_message_template(message_template, **item)
+    if message_template:
+        for rendered_items in render_message_template_batch(message_template, items):
             blocks += template_func(rendered_items)
-        else:
+    else:
+        for item in items:
             blocks += template_func(**item)["blocks"]
 
     blocks_grouped = []
     if items:
         if items[0].get("items_grouped"):
-            for item in items[0]["items_grouped"]:
-                rendered_items_grouped = render_message_template(
-                    items[0]["items_grouped_template"], **item
-                )
+            for rendered_items_grouped in render_message_template_batch(
+                items[0]["items_grouped_template"], items[0]["items_grouped"]
+            ):
                 blocks_grouped += template_func(rendered_items_grouped)
 
     return blocks + blocks_grouped
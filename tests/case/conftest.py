@@ -0,0 +1,34 @@
+import pytest
+
+from sqlalchemy import event
+
+from tests.database import Session
+
+
+@pytest.fixture(scope="function", autouse=True)
+def session(db):
+    """
+    Creates a new database session bound to an outer transaction that is
+    rolled back at the end of the test. Commits made during the test only
+    release a savepoint, which is restarted right away, so nothing reaches disk.
+    """
+    # other tests leave their session in the registry, we need one bound to our connection
+    Session.remove()
+
+    connection = db.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection)
+    session.begin_nested()
+
+    @event.listens_for(session, "after_transaction_end")
+    def restart_savepoint(session, transaction):
+        if transaction.nested and not transaction.parent.nested:
+            # expire state the same way a top level commit would
+            session.expire_all()
+            session.begin_nested()
+
+    yield session
+
+    Session.remove()
+    transaction.rollback()
+    connection.close()
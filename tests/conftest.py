@@ -107,7 +107,7 @@ def db():
         }
     )
     Session.configure(bind=schema_engine)
-    yield
+    yield schema_engine
     drop_database(str(config.SQLALCHEMY_DATABASE_URI))
 
 
@@ -0,0 +1,35 @@
+import pytest
+
+
+def test_create_rolls_back_on_participant_failure(
+    session, project, incident_type, incident_priority, monkeypatch
+):
+    from dispatch.incident import service as incident_service
+    from dispatch.incident.models import Incident, IncidentCreate
+    from dispatch.participant import flows as participant_flows
+    from dispatch.participant_role.models import ParticipantRoleType
+
+    incident_type.project = project
+    incident_priority.project = project
+    session.commit()
+
+    def add_participant(user_email, incident, db_session, service_id=None, role=None):
+        if role == ParticipantRoleType.incident_commander:
+            raise ValueError()
+
+    monkeypatch.setattr(participant_flows, "add_participant", add_participant)
+
+    incident_in = IncidentCreate(
+        title="Rolled back incident",
+        description="description",
+        project={"id": project.id, "name": project.name},
+        incident_type={"name": incident_type.name},
+        incident_priority={"name": incident_priority.name},
+        reporter={"individual": {"email": "reporter@example.com"}},
+    )
+
+    with pytest.raises(ValueError):
+        incident_service.create(db_session=session, incident_in=incident_in)
+
+    # the incident is rolled back along with its participants
+    assert not session.query(Incident).filter(Incident.title == incident_in.title).count()
@@ -0,0 +1,110 @@
+def test_render_message_template():
+    from dispatch.messaging.strings import render_message_template
+
+    message_template = [{"title": "Title - {{title}}", "text": "{{description}}", "type": "plain"}]
+
+    assert render_message_template(message_template, title="t", description="d") == [
+        {"title": "Title - t", "text": "d", "type": "plain"}
+    ]
+
+
+def test_render_message_template_static_text():
+    from dispatch.messaging.strings import render_message_template
+
+    message_template = [{"text": "Static text.\n"}]
+
+    # like jinja, static strings drop a single trailing newline
+    assert render_message_template(message_template) == [{"text": "Static text."}]
+
+
+def test_render_message_template_skips_empty_links():
+    from dispatch.messaging.strings import render_message_template
+
+    message_template = [
+        {"title": "Document", "title_link": "{{document_weblink}}", "text": "doc"},
+        {"title": "Storage", "title_link": "{{storage_weblink}}", "text": "storage"},
+        {"title": "Ticket", "title_link": "{{ticket_weblink}}", "text": "ticket"},
+    ]
+
+    rendered = render_message_template(
+        message_template, document_weblink="", storage_weblink=None, ticket_weblink="https://t"
+    )
+    assert rendered == [{"title": "Ticket", "title_link": "https://t", "text": "ticket"}]
+
+
+def test_render_message_template_truncates_text():
+    from dispatch.messaging.strings import MAX_TEXT_LEN, render_message_template
+
+    message_template = [{"title": "Description", "text": "{{description}}"}]
+
+    rendered = render_message_template(message_template, description="x" * (MAX_TEXT_LEN + 10))
+    assert rendered[0]["text"] == "x" * MAX_TEXT_LEN
+
+
+def test_render_message_template_status_mapping():
+    from dispatch.incident.enums import IncidentStatus
+    from dispatch.messaging.strings import (
+        INCIDENT_STATUS,
+        INCIDENT_STATUS_DESCRIPTIONS,
+        render_message_template,
+    )
+
+    rendered = render_message_template([INCIDENT_STATUS], status=IncidentStatus.stable)
+    assert rendered == [
+        {
+            "title": f"Status - {IncidentStatus.stable}",
+            "text": INCIDENT_STATUS_DESCRIPTIONS[IncidentStatus.stable],
+        }
+    ]
+
+
+def test_render_message_template_buttons():
+    from dispatch.messaging.strings import render_message_template
+
+    message_template = [
+        {
+            "title": "{{title}}",
+            "buttons": [
+                {
+                    "button_text": "Join {{name}}",
+                    "button_value": "{{organization_slug}}-{{id}}",
+                    "button_action": "join",
+                    "button_url": "",
+                }
+            ],
+        }
+    ]
+
+    rendered = render_message_template(
+        message_template, title="t", name="n", organization_slug="o", id=1
+    )
+    assert rendered == [
+        {
+            "title": "t",
+            "buttons": [
+                {
+                    "button_text": "Join n",
+                    "button_value": "o-1",
+                    "button_action": "join",
+                    "button_url": "",
+                }
+            ],
+        }
+    ]
+
+
+def test_render_message_template_batch():
+    from dispatch.messaging.strings import (
+        INCIDENT_TASK_LIST_DESCRIPTION,
+        render_message_template,
+        render_message_template_batch,
+    )
+
+    message_template = (
+        {"title": "{{title}}", "title_link": "{{weblink}}", "text": INCIDENT_TASK_LIST_DESCRIPTION},
+    )
+    items = [dict(title="a", weblink="https://a"), dict(title="b", weblink="")]
+
+    rendered = render_message_template_batch(message_template, items)
+    assert rendered == [render_message_template(message_template, **item) for item in items]
+    assert rendered[1] == []
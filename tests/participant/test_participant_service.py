@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_get(session, participant):
     from dispatch.participant.service import get
 
@@ -14,6 +17,58 @@ def test_create(session, participant_role):
     assert participant
 
 
+def test_create_in_batch(session):
+    from dispatch.participant.service import create, get, participant_batch
+    from dispatch.participant.models import ParticipantCreate
+    from dispatch.participant_role.models import ParticipantRoleCreate, ParticipantRoleType
+
+    participant_in = ParticipantCreate(
+        participant_roles=[ParticipantRoleCreate(role=ParticipantRoleType.scribe)]
+    )
+
+    transaction = session.transaction
+    with participant_batch(session):
+        participant = create(db_session=session, participant_in=participant_in)
+        assert "participant_batch" in session.info
+
+    assert "participant_batch" not in session.info
+    # the batch leaves the savepoint opened by the session fixture to us
+    assert session.transaction is transaction
+    participant = get(db_session=session, participant_id=participant.id)
+    assert participant.participant_roles[0].role == ParticipantRoleType.scribe
+
+
+def test_create_in_batch_defers_commit(session):
+    from dispatch.participant.service import create, get, participant_batch
+    from dispatch.participant.models import ParticipantCreate
+    from dispatch.participant_role.models import ParticipantRoleCreate, ParticipantRoleType
+
+    participant_in = ParticipantCreate(
+        participant_roles=[ParticipantRoleCreate(role=ParticipantRoleType.scribe)]
+    )
+
+    with pytest.raises(ValueError):
+        with participant_batch(session):
+            participant = create(db_session=session, participant_in=participant_in)
+            participant_id = participant.id
+            raise ValueError()
+
+    # the commit made by create only released a savepoint, so it is rolled back with the batch
+    assert not get(db_session=session, participant_id=participant_id)
+
+
+def test_create_all(session):
+    from dispatch.participant.service import create_all
+    from dispatch.participant.models import ParticipantCreate
+
+    locations = ["first", "second", "third"]
+    participants_in = [ParticipantCreate(location=location) for location in locations]
+
+    participants = create_all(db_session=session, participants_in=participants_in)
+    assert [participant.location for participant in participants] == locations
+    assert all(participant.id for participant in participants)
+
+
 def test_update(session, participant):
     from dispatch.participant.service import update
     from dispatch.participant.models import ParticipantUpdate